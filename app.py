@@ -1,22 +1,5 @@
 import streamlit as st
 import json
-import nltk
-
-# Download necessary NLTK data
-try:
-    nltk.data.find('tokenizers/punkt')
-except LookupError:
-    nltk.download('punkt')
-
-try:
-    nltk.data.find('tokenizers/punkt_tab')
-except LookupError:
-    nltk.download('punkt_tab')
-
-try:
-    nltk.data.find('taggers/averaged_perceptron_tagger')
-except LookupError:
-    nltk.download('averaged_perceptron_tagger')
 
 from scoring.scorer import compute_scores, load_rubric
 
@@ -27,8 +10,12 @@ st.title("🗣️ Communication Skills Scoring Tool (Intern Case Study)")
 st.write("Paste your transcript below and get a full rubric-based score (0-100).")
 
 
-# Load rubric once
-rubric = load_rubric()
+# Load rubric once per server process (survives reruns)
+@st.cache_resource
+def _rubric():
+    return load_rubric()
+
+rubric = _rubric()
 
 # User Input Section
 st.header("📥 Input Transcript")
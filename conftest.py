@@ -0,0 +1 @@
+# Keeps the repository root importable (``import scoring``) when running pytest.
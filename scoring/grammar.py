@@ -1,21 +1,151 @@
-import language_tool_python
+import atexit
+import hashlib
+import logging
+import os
+import threading
+from bisect import bisect_right
 
-tool = language_tool_python.LanguageTool('en-US')
+import diskcache
 
-def grammar_score(text, total_words):
-    matches = tool.check(text)
-    errors = len(matches)
-    
-    if total_words == 0:
-        return 10, 0
+logger = logging.getLogger(__name__)
+
+# Opt-in (LT_USE_PUBLIC_API=1): send transcripts shorter than PUBLIC_API_MAX_WORDS
+# to the public languagetool.org API instead of the local JVM. Off by default,
+# since it sends the transcript to a third-party server and needs internet access.
+USE_PUBLIC_API = os.environ.get("LT_USE_PUBLIC_API", "").strip().lower() in ("1", "true", "yes")
+PUBLIC_API_MAX_WORDS = 200
+
+# Transcripts shorter than this are too short to judge and get the full score
+# without a LanguageTool call.
+MIN_WORDS_FOR_CHECK = 20
+
+# score_ratio bucket lower bounds and the score for each bucket
+_GRAMMAR_THRESH = [0.3, 0.5, 0.7, 0.9]
+_GRAMMAR_SCORE = [2, 4, 6, 8, 10]
+
+# Separator used to check many transcripts in one LanguageTool request
+_BATCH_BREAK = "\n\n###TRANSCRIPTBREAK###\n\n"
+
+# Error counts keyed by transcript hash, persisted across runs so re-scoring
+# the same text skips the LanguageTool round-trip. Kept next to the package,
+# not in the current working directory.
+CACHE_DIR = os.path.join(os.path.dirname(__file__), ".lt_cache")
+
+_tools = {}
+_tools_lock = threading.Lock()
+
+_cache = None
+_cache_lock = threading.Lock()
+
+def _get_cache():
+    # Opened on the first grammar check that needs it, not at import.
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = diskcache.Cache(CACHE_DIR)
+        return _cache
+
+def _get_tool(public=False):
+    # One shared instance per backend for the whole process, closed on exit.
+    with _tools_lock:
+        if public not in _tools:
+            # imported here so the LanguageTool client only loads once a check is needed
+            import language_tool_python
+            if public:
+                tool = language_tool_python.LanguageToolPublicAPI('en-US')
+            else:
+                tool = language_tool_python.LanguageTool('en-US')
+            atexit.register(tool.close)
+            _tools[public] = tool
+        return _tools[public]
+
+def _cache_key(text, public, batch=False):
+    # Public and local servers can report different errors, so cache them apart.
+    # Joined batch checks get their own namespace: LanguageTool's text-level rules
+    # make a transcript's count there depend on its neighbours.
+    backend = "public" if public else "local"
+    prefix = f"batch-{backend}" if batch else backend
+    return f"{prefix}:{hashlib.sha1(text.encode('utf-8')).hexdigest()}"
 
+def _check(text, public):
+    """
+    Run a LanguageTool check. If the public API fails (network error, rate
+    limit), fall back to the local server.
+    Returns (matches, public) where public tells which backend produced them.
+    """
+    if public:
+        try:
+            return _get_tool(public=True).check(text), True
+        except Exception as exc:
+            logger.warning("LanguageTool public API failed (%s); falling back to the local server.", exc)
+    return _get_tool(public=False).check(text), False
+
+def _score_from_errors(errors, total_words):
     errors_per_100 = (errors / total_words) * 100
     score_ratio = 1 - min(errors_per_100 / 10, 1)
 
-    if score_ratio >= 0.9: score = 10
-    elif score_ratio >= 0.7: score = 8
-    elif score_ratio >= 0.5: score = 6
-    elif score_ratio >= 0.3: score = 4
-    else: score = 2
+    score = _GRAMMAR_SCORE[bisect_right(_GRAMMAR_THRESH, score_ratio)]
 
     return score, errors
+
+def grammar_score(text, total_words):
+    if total_words < MIN_WORDS_FOR_CHECK:
+        return 10, 0
+
+    public = USE_PUBLIC_API and total_words < PUBLIC_API_MAX_WORDS
+    cache = _get_cache()
+    errors = cache.get(_cache_key(text, public))
+    if errors is None:
+        matches, used_public = _check(text, public)
+        errors = len(matches)
+        cache[_cache_key(text, used_public)] = errors
+
+    return _score_from_errors(errors, total_words)
+
+def grammar_score_batch(texts, word_counts):
+    # Score many transcripts with a single LanguageTool request for all the
+    # uncached ones, sharing the singleton tool. Per-transcript cache entries
+    # written by grammar_score are reused but never written here; counts from the
+    # joined check are cached per joined text, under the batch namespace.
+    checked_words = sum(w for w in word_counts if w >= MIN_WORDS_FOR_CHECK)
+    public = USE_PUBLIC_API and checked_words < PUBLIC_API_MAX_WORDS
+
+    errors = [0] * len(texts)
+    pending = []
+    for i, (text, total_words) in enumerate(zip(texts, word_counts)):
+        if total_words < MIN_WORDS_FOR_CHECK:
+            continue
+        cached = _get_cache().get(_cache_key(text, public))
+        if cached is None:
+            pending.append(i)
+        else:
+            errors[i] = cached
+
+    if pending:
+        # Join the transcripts, check once, then bucket matches by offset.
+        # Matches that fall inside a separator are dropped.
+        starts = []
+        pos = 0
+        for i in pending:
+            starts.append(pos)
+            pos += len(texts[i]) + len(_BATCH_BREAK)
+        joined = _BATCH_BREAK.join(texts[i] for i in pending)
+
+        cache = _get_cache()
+        counts = cache.get(_cache_key(joined, public, batch=True))
+        if counts is None:
+            matches, used_public = _check(joined, public)
+            counts = [0] * len(pending)
+            for match in matches:
+                j = bisect_right(starts, match.offset) - 1
+                if match.offset < starts[j] + len(texts[pending[j]]):
+                    counts[j] += 1
+            cache[_cache_key(joined, used_public, batch=True)] = counts
+
+        for j, i in enumerate(pending):
+            errors[i] = counts[j]
+
+    return [
+        (10, 0) if total_words < MIN_WORDS_FOR_CHECK else _score_from_errors(errors[i], total_words)
+        for i, total_words in enumerate(word_counts)
+    ]
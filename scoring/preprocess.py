@@ -1,22 +1,28 @@
 import re
-import nltk
-from nltk.tokenize import word_tokenize, sent_tokenize
 
-from nltk.tokenize import word_tokenize, sent_tokenize
+# Hyphenated words ("well-known") stay one token, as they did with NLTK
+_WORD_RE = re.compile(r"[A-Za-z0-9']+(?:-[A-Za-z0-9']+)*")
+_SENT_RE = re.compile(r"[^.!?\s][^.!?]*(?:[.!?]+|$)")
 
 FILLER_WORDS = ["um", "uh", "like", "you know", "so", "actually", "basically",
                 "right", "i mean", "well", "kinda", "sort of", "okay", "hmm", "ah"]
 
+# Single alternation over all fillers (longest first) so one scan finds every
+# occurrence, including multi-word fillers that word tokenization splits apart.
+# The anchors treat hyphens and apostrophes as part of a word, so "well-known"
+# or "so-called" are not counted as fillers.
+_FILLER_RE = re.compile(r"(?<![\w'-])(?:" + "|".join(re.escape(w) for w in sorted(FILLER_WORDS, key=len, reverse=True)) + r")(?![\w'-])")
+
 def clean_text(text):
     return text.lower().strip()
 
 def get_word_count(text):
-    words = word_tokenize(text)
+    words = _WORD_RE.findall(text)
     return len(words), words
 
 def get_sentence_count(text):
-    return len(sent_tokenize(text))
+    return len(_SENT_RE.findall(text))
 
-def count_filler_words(words):
-    count = sum(1 for w in words if w in FILLER_WORDS)
+def count_filler_words(text):
+    count = sum(1 for _ in _FILLER_RE.finditer(text))
     return count
@@ -6,30 +6,67 @@ to compute per-criterion scores and an overall normalized score (0-100).
 
 Assumes the following modules/files exist in the scoring/ package:
 - preprocess.py (clean_text, get_word_count, get_sentence_count, count_filler_words)
-- grammar.py (grammar_score)
+- grammar.py (grammar_score, grammar_score_batch)
 - vocabulary.py (vocabulary_score)
 - sentiment.py (sentiment_score)
-- semantic.py (semantic_similarity)
+- semantic.py (semantic_similarity, semantic_similarity_batch; imported lazily)
 - rubric.json (created in Phase 1; contains weights & rules)
 """
 
-import json
+import logging
 import os
+import re
+from bisect import bisect_left
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from typing import Dict, Any, List, Tuple
 
+import orjson
+
 from scoring.preprocess import clean_text, get_word_count, get_sentence_count, count_filler_words
-from scoring.grammar import grammar_score
+from scoring.grammar import grammar_score, grammar_score_batch
 from scoring.vocabulary import vocabulary_score
 from scoring.sentiment import sentiment_score
-from scoring.semantic import semantic_similarity
+
+logger = logging.getLogger(__name__)
 
 # Path to rubric JSON (make sure this file exists)
 RUBRIC_PATH = os.path.join(os.path.dirname(__file__), "rubric.json")
 
+# Example indicators for each flow placeholder, based on the rubric order
+FLOW_INDICATORS = {
+    "salutation": ["hello", "hi", "good morning", "good afternoon", "good evening", "good day", "excited to introduce"],
+    "basic_details": ["my name is", "i am", "i'm", "age", "years old", "class", "grade", "school", "studying in", "student of"],
+    "optional_details": ["family", "parents", "father", "mother", "hobby", "hobbies", "interest", "like to", "ambition", "goal", "dream", "strength", "weakness", "achievement", "fun fact"],
+    "closing": ["thank you", "thanks", "that's all", "bye"]
+}
+
+# One alternation with a named group per category. The lookahead keeps matches
+# from consuming text, so overlapping indicators of different categories are still seen.
+_FLOW_RE = re.compile(
+    "(?=(?:" + "|".join(f"(?P<{key}>{'|'.join(map(re.escape, tokens))})" for key, tokens in FLOW_INDICATORS.items()) + "))"
+)
+
+# Speech-rate buckets: upper WPM bound (inclusive) of each bucket, then the
+# rubric rule, default score and label for each bucket
+_SR_THRESH = [80, 110, 140, 160]
+_SR_BUCKETS = [("too_slow", 2, "Too slow"), ("slow", 6, "Slow"), ("ideal", 10, "Ideal"), ("fast", 6, "Fast"), ("too_fast", 2, "Too fast")]
+
+# Filler-count buckets: upper count bound (inclusive) of each bucket, then the
+# rubric key and default score for each bucket
+_FILLER_THRESH = [3, 6, 9, 12]
+_FILLER_BUCKETS = [("0-3", 15), ("4-6", 12), ("7-9", 9), ("10-12", 6), ("13+", 3)]
 
+# Shared pool for the independent heavy scorers (LanguageTool RPC, VADER, MiniLM);
+# they release the GIL on socket I/O / torch kernels so threads overlap them.
+_executor = ThreadPoolExecutor(max_workers=3)
+
+
+@lru_cache(maxsize=1)
 def load_rubric(path: str = RUBRIC_PATH) -> Dict[str, Any]:
-    with open(path, "r", encoding="utf-8") as f:
-        return json.load(f)
+    """Load and parse the rubric once; the returned dict is shared and must not be mutated."""
+    with open(path, "rb") as f:
+        return orjson.loads(f.read())
 
 
 def _normalize(subscore: float, max_score: float) -> float:
@@ -54,21 +91,21 @@ def _map_range_score(value: float, ranges: List[Tuple[float, float, float]]) ->
 def score_salutation(text: str, rubric_salutation: Dict[str, Any]) -> Tuple[float, str]:
     """
     Score salutation based on rubric rules.
+    Expects the already-lowercased text from clean_text.
     Returns (score, feedback)
     """
-    txt = text.lower()
     rules = rubric_salutation.get("rules", {})
     feedback = []
     sal_score = 0.0
 
     # Check excellent first
-    if any(kw in txt for kw in rules.get("excellent", {}).get("keywords", [])):
+    if any(kw in text for kw in rules.get("excellent", {}).get("keywords", [])):
         sal_score = rules["excellent"]["score"]
         feedback.append("Excellent salutation found (e.g., 'excited to introduce').")
-    elif any(kw in txt for kw in rules.get("good", {}).get("keywords", [])):
+    elif any(kw in text for kw in rules.get("good", {}).get("keywords", [])):
         sal_score = rules["good"]["score"]
         feedback.append("Good salutation found (e.g., 'good morning', 'hello everyone').")
-    elif any(kw in txt for kw in rules.get("normal", {}).get("keywords", [])):
+    elif any(kw in text for kw in rules.get("normal", {}).get("keywords", [])):
         sal_score = rules["normal"]["score"]
         feedback.append("Normal salutation found (e.g., 'hi', 'hello').")
     else:
@@ -78,11 +115,32 @@ def score_salutation(text: str, rubric_salutation: Dict[str, Any]) -> Tuple[floa
     return float(sal_score), " ".join(feedback)
 
 
-def score_keyword_presence(words: List[str], text: str, rubric_kw: Dict[str, Any]) -> Tuple[float, List[str], str]:
+@lru_cache(maxsize=None)
+def _keyword_matcher(keywords: Tuple[str, ...]):
     """
-    Score keyword presence according to must-have and good-to-have lists.
-    We also supplement with semantic matching for robustness.
-    Returns (raw_score, found_keywords_list, feedback)
+    Precompute matchers for a keyword list (cached per rubric list):
+    a frozenset of single-word keywords, the multi-word keywords, and the rubric order.
+    """
+    singles = frozenset(kw for kw in keywords if " " not in kw)
+    multi = tuple(kw for kw in keywords if " " in kw)
+    order = {kw: i for i, kw in enumerate(keywords)}
+    return singles, multi, order
+
+
+def _match_keywords(keywords: Tuple[str, ...], wordset: set, text_lower: str) -> List[str]:
+    """Return the keywords present in the text, in rubric order."""
+    singles, multi, order = _keyword_matcher(keywords)
+    hits = singles & wordset
+    # Substring check per multi-word keyword, so keywords that overlap or share
+    # a start position ("my name", "my name is") are all found
+    hits = hits.union(kw for kw in multi if kw in text_lower)
+    return sorted(hits, key=order.__getitem__)
+
+
+def _exact_keyword_matches(words: List[str], text: str, rubric_kw: Dict[str, Any]) -> Tuple[List[str], float]:
+    """
+    Exact must-have / good-to-have keyword matching on the already-lowercased text.
+    Returns (found_keywords_list, raw_score)
     """
     must_have = rubric_kw.get("must_have", {})
     good_to_have = rubric_kw.get("good_to_have", {})
@@ -90,44 +148,58 @@ def score_keyword_presence(words: List[str], text: str, rubric_kw: Dict[str, Any
     mw = must_have.get("keywords", [])
     gw = good_to_have.get("keywords", [])
 
-    found = []
-    raw_score = 0.0
-
     # simple exact match (word boundaries)
     wordset = set(words)
-    text_lower = text.lower()
-    
-    # Check Must Have
-    for kw in mw:
-        # handle multi-word keywords
-        if " " in kw:
-            if kw in text_lower:
-                found.append(kw)
-                raw_score += must_have.get("score_each", 4)
-        else:
-            if kw in wordset:
-                found.append(kw)
-                raw_score += must_have.get("score_each", 4)
-
-    # Check Good to Have
-    for kw in gw:
-        if " " in kw:
-            if kw in text_lower:
-                found.append(kw)
-                raw_score += good_to_have.get("score_each", 2)
-        else:
-            if kw in wordset:
-                found.append(kw)
-                raw_score += good_to_have.get("score_each", 2)
+
+    # Check Must Have, then Good to Have
+    found_mw = _match_keywords(tuple(mw), wordset, text)
+    found_gw = _match_keywords(tuple(gw), wordset, text)
+    found = found_mw + found_gw
+    raw_score = len(found_mw) * must_have.get("score_each", 4) + len(found_gw) * good_to_have.get("score_each", 2)
+    return found, raw_score
+
+
+def _needs_semantic(found: List[str], rubric_kw: Dict[str, Any]) -> bool:
+    """True if too few exact matches were found and the semantic fallback should run."""
+    mw = rubric_kw.get("must_have", {}).get("keywords", [])
+    return len(found) < max(1, len(mw) // 2)
+
+
+def _semantic_phrases(rubric_kw: Dict[str, Any]) -> Tuple[str, ...]:
+    """All must-have and good-to-have phrases, as a tuple so their embeddings can be cached."""
+    mw = rubric_kw.get("must_have", {}).get("keywords", [])
+    gw = rubric_kw.get("good_to_have", {}).get("keywords", [])
+    return tuple(mw + gw)
+
+
+def score_keyword_presence(words: List[str], text: str, rubric_kw: Dict[str, Any], sim: float = None,
+                           exact: Tuple[List[str], float] = None) -> Tuple[float, List[str], str]:
+    """
+    Score keyword presence according to must-have and good-to-have lists.
+    We also supplement with semantic matching for robustness.
+    - sim: optional precomputed semantic similarity (used by batch scoring)
+    - exact: optional precomputed _exact_keyword_matches result (used by batch scoring)
+    Returns (raw_score, found_keywords_list, feedback)
+    """
+    must_have = rubric_kw.get("must_have", {})
+    mw = must_have.get("keywords", [])
+
+    if exact is None:
+        exact = _exact_keyword_matches(words, text, rubric_kw)
+    found, raw_score = list(exact[0]), exact[1]
 
     # If few matches found, use semantic similarity against "must have" phrase list
-    if len(found) < max(1, len(mw) // 2):
+    if _needs_semantic(found, rubric_kw):
         # compute semantic similarity between text and each must-have keyword/phrase
-        target_phrases = mw + gw
-        try:
-            sim = semantic_similarity(text, target_phrases)
-        except Exception:
-            sim = 0.0
+        if sim is None:
+            # imported lazily so MiniLM/onnxruntime only load when the fallback actually fires;
+            # kept outside the try so a missing or broken install fails loudly
+            from scoring.semantic import semantic_similarity
+            try:
+                sim = semantic_similarity(text, _semantic_phrases(rubric_kw))
+            except Exception:
+                logger.warning("Semantic similarity failed; treating it as 0.", exc_info=True)
+                sim = 0.0
         # If average similarity is reasonably high, give partial credit
         if sim >= 0.6:
             bonus = 0.5 * sum([must_have.get("score_each", 4) for _ in mw])
@@ -146,24 +218,16 @@ def score_keyword_presence(words: List[str], text: str, rubric_kw: Dict[str, Any
 def score_flow(text: str, rubric_flow: Dict[str, Any]) -> Tuple[float, str]:
     """
     Check whether basic order is followed: salutation -> basic details -> optional -> closing
-    We'll approximate by checking indices of place-holder tokens in text.
+    We'll approximate by checking indices of place-holder tokens in the already-lowercased text.
     """
     order_spec = rubric_flow.get("rules", {}).get("correct_order", {}).get("order", [])
-    # Map placeholder tokens to example indicators based on new rubric
-    indicators = {
-        "salutation": ["hello", "hi", "good morning", "good afternoon", "good evening", "good day", "excited to introduce"],
-        "basic_details": ["my name is", "i am", "i'm", "age", "years old", "class", "grade", "school", "studying in", "student of"],
-        "optional_details": ["family", "parents", "father", "mother", "hobby", "hobbies", "interest", "like to", "ambition", "goal", "dream", "strength", "weakness", "achievement", "fun fact"],
-        "closing": ["thank you", "thanks", "that's all", "bye"]
-    }
-
-    text_l = text.lower()
     positions = {}
-    
-    # Find the FIRST occurrence of any indicator for each category
-    for key, tokens in indicators.items():
-        pos_list = [text_l.find(tok) for tok in tokens if text_l.find(tok) != -1]
-        positions[key] = min(pos_list) if pos_list else None
+
+    # Find the FIRST occurrence of any indicator for each category in a single scan
+    for m in _FLOW_RE.finditer(text):
+        positions.setdefault(m.lastgroup, m.start())
+        if len(positions) == len(FLOW_INDICATORS):
+            break
 
     # Check if positions are in increasing order ignoring None
     seq = []
@@ -197,22 +261,10 @@ def score_speech_rate(word_count: int, duration_seconds: float, rubric_sr: Dict[
     wpm = (word_count / duration_seconds) * 60.0
     # find which bracket it falls into (we can parse rubric_sr rules)
     rules = rubric_sr.get("rules", {})
-    # manual mapping according to rubric ranges:
-    if wpm > 161:
-        score = rules.get("too_fast", {}).get("score", 2)
-        msg = f"Too fast ({wpm:.0f} WPM)."
-    elif 141 <= wpm <= 160:
-        score = rules.get("fast", {}).get("score", 6)
-        msg = f"Fast ({wpm:.0f} WPM)."
-    elif 111 <= wpm <= 140:
-        score = rules.get("ideal", {}).get("score", 10)
-        msg = f"Ideal ({wpm:.0f} WPM)."
-    elif 81 <= wpm <= 110:
-        score = rules.get("slow", {}).get("score", 6)
-        msg = f"Slow ({wpm:.0f} WPM)."
-    else:
-        score = rules.get("too_slow", {}).get("score", 2)
-        msg = f"Too slow ({wpm:.0f} WPM)."
+    # mapping according to rubric ranges (<=80, 81-110, 111-140, 141-160, >160)
+    rule, default, label = _SR_BUCKETS[bisect_left(_SR_THRESH, wpm)]
+    score = rules.get(rule, {}).get("score", default)
+    msg = f"{label} ({wpm:.0f} WPM)."
 
     return float(score), msg + f" ({wpm:.1f} WPM)"
 
@@ -230,17 +282,8 @@ def score_filler_words(filler_count: int, total_words: int, rubric_clarity: Dict
     # Translate rubric buckets (they were defined as 0-3, 4-6 etc counted absolute filler counts,
     # but we receive filler_count absolute. We'll directly use counts to map.)
     # We'll use counts (not percent) because rubric uses absolute counts.
-    fc = filler_count
-    if fc <= 3:
-        score = scoring.get("0-3", 15)
-    elif 4 <= fc <= 6:
-        score = scoring.get("4-6", 12)
-    elif 7 <= fc <= 9:
-        score = scoring.get("7-9", 9)
-    elif 10 <= fc <= 12:
-        score = scoring.get("10-12", 6)
-    else:
-        score = scoring.get("13+", 3)
+    key, default = _FILLER_BUCKETS[bisect_left(_FILLER_THRESH, filler_count)]
+    score = scoring.get(key, default)
 
     feedback = f"{filler_count} filler words detected ({rate_percent:.2f}% of words)."
     return float(score), feedback
@@ -260,8 +303,80 @@ def compute_scores(transcript: str, duration_seconds: float = None, rubric: Dict
     # Preprocess
     text = clean_text(transcript)
     word_count, words = get_word_count(text)
+
+    # Kick off the expensive, independent scorers so they run concurrently
+    cs = rubric.get("content_and_structure", {})
+    gram_future = _executor.submit(grammar_score, transcript, word_count)
+    sent_future = _executor.submit(sentiment_score, transcript)
+    kw_future = _executor.submit(score_keyword_presence, words, text, cs.get("keyword_presence", {}))
+
+    return _build_results(transcript, text, words, duration_seconds, rubric,
+                          kw_future.result(), gram_future.result(), sent_future.result())
+
+
+def compute_scores_batch(transcripts: List[str], durations: List[float] = None, rubric: Dict[str, Any] = None) -> List[Dict[str, Any]]:
+    """
+    Batch entrypoint for scoring many transcripts at once:
+    - transcripts: list of texts to evaluate
+    - durations: optional list of speech durations (seconds), aligned with transcripts
+    - rubric: optional preloaded rubric dict (otherwise loads from file)
+    The expensive models run once per batch (one MiniLM encode for every transcript
+    needing the semantic fallback, one grammar pass) instead of once per transcript.
+    Returns a list of result dicts in the same shape as compute_scores.
+    """
+    if rubric is None:
+        rubric = load_rubric()
+    if durations is None:
+        durations = [None] * len(transcripts)
+    elif len(durations) != len(transcripts):
+        raise ValueError(f"durations has {len(durations)} entries but transcripts has {len(transcripts)}")
+
+    # Preprocess
+    texts = [clean_text(t) for t in transcripts]
+    word_lists = [get_word_count(t)[1] for t in texts]
+    word_counts = [len(w) for w in word_lists]
+
+    gram_future = _executor.submit(grammar_score_batch, transcripts, word_counts)
+    sent_future = _executor.submit(lambda: [sentiment_score(t) for t in transcripts])
+
+    # Semantic fallback: encode only the transcripts that need it, in one batch
+    kw_rubric = rubric.get("content_and_structure", {}).get("keyword_presence", {})
+    exact = [_exact_keyword_matches(words, text, kw_rubric) for words, text in zip(word_lists, texts)]
+    need = [i for i, (found, _) in enumerate(exact) if _needs_semantic(found, kw_rubric)]
+    sims = {}
+    if need:
+        # imported lazily so MiniLM/onnxruntime only load when the fallback actually fires;
+        # kept outside the try so a missing or broken install fails loudly
+        from scoring.semantic import semantic_similarity_batch
+        try:
+            batch_sims = semantic_similarity_batch([texts[i] for i in need], _semantic_phrases(kw_rubric))
+        except Exception:
+            logger.warning("Semantic similarity failed; treating it as 0.", exc_info=True)
+            batch_sims = [0.0] * len(need)
+        sims = dict(zip(need, batch_sims))
+
+    gram_results = gram_future.result()
+    sent_results = sent_future.result()
+
+    return [
+        _build_results(transcripts[i], texts[i], word_lists[i], durations[i], rubric,
+                       score_keyword_presence(word_lists[i], texts[i], kw_rubric, sim=sims.get(i), exact=exact[i]),
+                       gram_results[i], sent_results[i])
+        for i in range(len(transcripts))
+    ]
+
+
+def _build_results(transcript: str, text: str, words: List[str], duration_seconds: float, rubric: Dict[str, Any],
+                   kw_result: Tuple[float, List[str], str], gram_result: Tuple[float, int],
+                   sent_result: Tuple[float, float]) -> Dict[str, Any]:
+    """
+    Assemble the per-criterion results dict for one preprocessed transcript,
+    given the already-computed keyword, grammar and sentiment scores.
+    """
+    word_count = len(words)
     sentence_count = get_sentence_count(text)
-    filler_count = count_filler_words(words)
+    filler_count = count_filler_words(text)
+    cs = rubric.get("content_and_structure", {})
 
     results = {
         "word_count": word_count,
@@ -274,17 +389,16 @@ def compute_scores(transcript: str, duration_seconds: float = None, rubric: Dict
     weighted_score_sum = 0.0
 
     # --- Content & Structure (composed of salutation, keywords, flow)
-    cs = rubric.get("content_and_structure", {})
     cs_weight = cs.get("weight", 0)
     total_weight += cs_weight
     cs_subscores = {}
 
     # Salutation
-    sal_score_raw, sal_feedback = score_salutation(transcript, cs.get("salutation", {}))
+    sal_score_raw, sal_feedback = score_salutation(text, cs.get("salutation", {}))
     cs_subscores["salutation"] = {"raw": sal_score_raw, "max": cs.get("salutation", {}).get("weight", 5), "feedback": sal_feedback}
 
     # Keyword presence
-    kw_raw, found_kws, kw_feedback = score_keyword_presence(words, text, cs.get("keyword_presence", {}))
+    kw_raw, found_kws, kw_feedback = kw_result
     # The rubric had keyword presence weight 30 (split across must & good) — interpret raw as points up to sum of must/good totals.
     kw_max = cs.get("keyword_presence", {}).get("weight", 30)
     # If raw exceeds kw_max, clip
@@ -338,7 +452,7 @@ def compute_scores(transcript: str, duration_seconds: float = None, rubric: Dict
     lang_subscores = {}
 
     # Grammar
-    gram_score_raw, gram_errors = grammar_score(transcript, word_count)
+    gram_score_raw, gram_errors = gram_result
     gram_max = lang.get("grammar", {}).get("weight", 10)
     lang_subscores["grammar"] = {"raw": gram_score_raw, "max": gram_max, "errors": gram_errors}
 
@@ -386,7 +500,7 @@ def compute_scores(transcript: str, duration_seconds: float = None, rubric: Dict
     engagement = rubric.get("engagement", {})
     engagement_weight = engagement.get("weight", 0)
     total_weight += engagement_weight
-    sent_score_raw, polarity = sentiment_score(transcript)
+    sent_score_raw, polarity = sent_result
     sent_max = 15.0
     sent_fraction = _normalize(sent_score_raw, sent_max)
     sent_contribution = sent_fraction * engagement_weight
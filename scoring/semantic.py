@@ -1,14 +1,46 @@
-from sentence_transformers import SentenceTransformer, util
+import threading
+from functools import lru_cache
 
-model = SentenceTransformer("all-MiniLM-L6-v2")
+from sentence_transformers import SentenceTransformer
+
+_model = None
+_model_lock = threading.Lock()
+
+def _get_model():
+    # Built on first use and shared for the whole process (survives Streamlit reruns).
+    global _model
+    with _model_lock:
+        if _model is None:
+            # ONNX Runtime backend with the int8-quantized export: fused attention /
+            # LayerNorm kernels and integer matmuls are much faster than eager PyTorch on CPU
+            _model = SentenceTransformer(
+                "all-MiniLM-L6-v2",
+                backend="onnx",
+                model_kwargs={"file_name": "onnx/model_quint8_avx2.onnx"},
+            )
+        return _model
+
+@lru_cache(maxsize=None)
+def _encode_phrases(phrases):
+    # Rubric phrases are static, so their embeddings are computed once per process.
+    return _get_model().encode(list(phrases), convert_to_tensor=True,
+                               normalize_embeddings=True, batch_size=32)
 
 def semantic_similarity(text, target_phrases):
-    text_emb = model.encode(text)
-    scores = []
+    return semantic_similarity_batch([text], target_phrases)[0]
+
+def semantic_similarity_batch(texts, target_phrases):
+    # Average similarity to the target phrases for each text, with all texts
+    # encoded in one batched forward pass.
+    if not texts:
+        return []
+    if not target_phrases:
+        return [0.0] * len(texts)
 
-    for phrase in target_phrases:
-        phrase_emb = model.encode(phrase)
-        sim = float(util.pytorch_cos_sim(text_emb, phrase_emb))
-        scores.append(sim)
+    # Embeddings are normalized, so cosine similarity is a plain dot product.
+    text_embs = _get_model().encode(list(texts), convert_to_tensor=True,
+                                    normalize_embeddings=True, batch_size=32)
+    phrase_embs = _encode_phrases(tuple(target_phrases))
+    sims = text_embs @ phrase_embs.T
 
-    return sum(scores) / len(scores)
+    return sims.mean(dim=1).tolist()
@@ -1,14 +1,26 @@
+import threading
+from bisect import bisect_right
+
 from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
 
-analyzer = SentimentIntensityAnalyzer()
+# Positive-polarity bucket lower bounds and the score for each bucket
+_SENT_THRESH = [0.3, 0.5, 0.7, 0.9]
+_SENT_SCORE = [3, 6, 9, 12, 15]
+
+_analyzer = None
+_analyzer_lock = threading.Lock()
+
+def _get_analyzer():
+    # Built on first use and shared for the whole process (survives Streamlit reruns).
+    global _analyzer
+    with _analyzer_lock:
+        if _analyzer is None:
+            _analyzer = SentimentIntensityAnalyzer()
+        return _analyzer
 
 def sentiment_score(text):
-    polarity = analyzer.polarity_scores(text)['pos']
+    polarity = _get_analyzer().polarity_scores(text)['pos']
 
-    if polarity >= 0.9: score = 15
-    elif polarity >= 0.7: score = 12
-    elif polarity >= 0.5: score = 9
-    elif polarity >= 0.3: score = 6
-    else: score = 3
+    score = _SENT_SCORE[bisect_right(_SENT_THRESH, polarity)]
 
     return score, polarity
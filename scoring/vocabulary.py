@@ -1,3 +1,9 @@
+from bisect import bisect_right
+
+# TTR bucket lower bounds and the score for each bucket
+_VOC_THRESH = [0.3, 0.5, 0.7, 0.9]
+_VOC_SCORE = [2, 4, 6, 8, 10]
+
 def vocabulary_score(words):
     if len(words) == 0:
         return 10, 1.0
@@ -5,10 +11,6 @@ def vocabulary_score(words):
     distinct = len(set(words))
     ttr = distinct / len(words)
 
-    if ttr >= 0.9: score = 10
-    elif ttr >= 0.7: score = 8
-    elif ttr >= 0.5: score = 6
-    elif ttr >= 0.3: score = 4
-    else: score = 2
+    score = _VOC_SCORE[bisect_right(_VOC_THRESH, ttr)]
 
     return score, ttr
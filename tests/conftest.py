@@ -0,0 +1,70 @@
+import re
+import sys
+
+import pytest
+
+from scoring import grammar
+
+
+class StubMatch:
+    def __init__(self, offset):
+        self.offset = offset
+
+
+class StubTool:
+    """
+    Stand-in for language_tool_python.LanguageTool. Flags every "teh", every
+    "###" (so separator hits can be checked) and, like LanguageTool's
+    text-level rules, a text that does not end with a period.
+    """
+
+    def __init__(self):
+        self.calls = []
+
+    def check(self, text):
+        self.calls.append(text)
+        matches = [StubMatch(m.start()) for m in re.finditer(r"\bteh\b|###", text)]
+        if not text.rstrip().endswith("."):
+            matches.append(StubMatch(len(text.rstrip()) - 1))
+        return matches
+
+
+@pytest.fixture
+def stub_tool(monkeypatch, tmp_path):
+    """Local LanguageTool replaced by a StubTool, with an empty on-disk cache."""
+    tool = StubTool()
+    monkeypatch.setattr(grammar, "_tools", {False: tool})
+    monkeypatch.setattr(grammar, "USE_PUBLIC_API", False)
+    monkeypatch.setattr(grammar, "CACHE_DIR", str(tmp_path / ".lt_cache"))
+    monkeypatch.setattr(grammar, "_cache", None)
+    return tool
+
+
+class StubSemantic:
+    """
+    Stand-in for the scoring.semantic module (MiniLM encoder). Similarity is
+    high only for texts mentioning "hobby", so results depend on which text
+    each score is paired with.
+    """
+
+    def __init__(self):
+        self.batch_calls = []
+
+    @staticmethod
+    def _sim(text):
+        return 0.8 if "hobby" in text else 0.1
+
+    def semantic_similarity(self, text, target_phrases):
+        return self._sim(text)
+
+    def semantic_similarity_batch(self, texts, target_phrases):
+        self.batch_calls.append(list(texts))
+        return [self._sim(t) for t in texts]
+
+
+@pytest.fixture
+def stub_semantic(monkeypatch):
+    """scoring.semantic replaced by a StubSemantic for the lazy imports in the scorer."""
+    stub = StubSemantic()
+    monkeypatch.setitem(sys.modules, "scoring.semantic", stub)
+    return stub
@@ -0,0 +1,79 @@
+from scoring.grammar import _BATCH_BREAK, grammar_score, grammar_score_batch
+
+# Both at least 20 words; A has two "teh" errors and no final period
+TEXT_A = "teh cat sat on the mat and teh dog sat on the rug while the bird sang in the tree all day long"
+TEXT_B = "the weather was pleasant today and we walked along the river before lunch with our friends from the school club."
+
+
+def _words(text):
+    return len(text.split())
+
+
+def test_batch_count_is_not_served_to_single_scoring(stub_tool):
+    # In the joined check TEXT_A is followed by a separator, so the stub's
+    # text-level rule counts it differently than when checked alone.
+    grammar_score_batch([TEXT_A, TEXT_B], [_words(TEXT_A), _words(TEXT_B)])
+    calls_after_batch = len(stub_tool.calls)
+
+    single = grammar_score(TEXT_A, _words(TEXT_A))
+
+    assert len(stub_tool.calls) == calls_after_batch + 1
+    assert stub_tool.calls[-1] == TEXT_A
+    assert single == (2, 3)
+
+
+def test_batch_reuses_single_cache_entries(stub_tool):
+    single = grammar_score(TEXT_A, _words(TEXT_A))
+    calls_after_single = len(stub_tool.calls)
+
+    batch = grammar_score_batch([TEXT_A], [_words(TEXT_A)])
+
+    assert len(stub_tool.calls) == calls_after_single
+    assert batch == [single]
+
+
+def test_repeated_batch_hits_batch_cache(stub_tool):
+    texts = [TEXT_A, TEXT_B]
+    counts = [_words(t) for t in texts]
+    first = grammar_score_batch(texts, counts)
+    second = grammar_score_batch(texts, counts)
+
+    assert len(stub_tool.calls) == 1
+    assert first == second
+
+
+TEXT_C = "my brother plays football every evening in the park near our house and he hopes to join teh city team next year."
+
+
+def test_batch_checks_only_uncached_inputs(stub_tool):
+    grammar_score(TEXT_B, _words(TEXT_B))
+    short = "hello there"
+    texts = [TEXT_B, TEXT_A, short, TEXT_C]
+
+    results = grammar_score_batch(texts, [_words(t) for t in texts])
+
+    # TEXT_B came from the cache and the short input was skipped, so the one
+    # joined check covered only TEXT_A and TEXT_C
+    assert stub_tool.calls[-1] == TEXT_A + _BATCH_BREAK + TEXT_C
+    assert len(stub_tool.calls) == 2
+    assert results[0] == grammar_score(TEXT_B, _words(TEXT_B))
+    assert results[2] == (10, 0)
+    assert [r[1] for r in results] == [0, 2, 0, 1]
+
+
+def test_batch_skips_short_inputs(stub_tool):
+    texts = ["teh cat", "", "a short teh answer"]
+
+    assert grammar_score_batch(texts, [_words(t) for t in texts]) == [(10, 0)] * 3
+    assert stub_tool.calls == []
+
+
+def test_batch_drops_matches_inside_separator(stub_tool):
+    texts = [TEXT_B, TEXT_C]
+    joined = _BATCH_BREAK.join(texts)
+    # one real error in TEXT_C plus two hits on the "###" in the separator itself
+    assert len(type(stub_tool)().check(joined)) == 3
+
+    results = grammar_score_batch(texts, [_words(t) for t in texts])
+
+    assert [r[1] for r in results] == [0, 1]
@@ -0,0 +1,66 @@
+import pytest
+
+from scoring.scorer import _match_keywords, compute_scores, compute_scores_batch, score_keyword_presence
+
+
+def test_match_keywords_overlapping_multi_word():
+    # Both keywords start at the same position; both must be found
+    assert _match_keywords(("my name", "my name is"), set(), "my name is raj") == ["my name", "my name is"]
+
+
+def test_match_keywords_keeps_rubric_order():
+    keywords = ("school", "about family", "family", "i am from")
+    text = "i am from delhi. about family: my family is small. i go to school"
+    words = set(text.replace(".", " ").replace(":", " ").split())
+    assert _match_keywords(keywords, words, text) == list(keywords)
+
+
+def test_score_keyword_presence_scores_overlapping_keywords():
+    rubric_kw = {
+        "must_have": {"score_each": 4, "keywords": ["my name", "my name is"]},
+        "good_to_have": {"score_each": 2, "keywords": []},
+    }
+    text = "my name is raj"
+    raw, found, _ = score_keyword_presence(text.split(), text, rubric_kw)
+    assert found == ["my name", "my name is"]
+    assert raw == 8.0
+
+
+BATCH_TRANSCRIPTS = [
+    # plenty of exact keywords: no semantic fallback
+    "Hello everyone, good morning. My name is Asha and my age is thirteen. I study in class eight at Green Valley school. "
+    "My family has four members. My hobby is painting and my dream is to become an artist. Thank you.",
+    # few keywords, mentions a hobby: fallback with high similarity
+    "Hi, I really enjoy my hobby of drawing comics and I spend many evenings practising new styles with my friends. Thanks.",
+    # few keywords, no hobby: fallback with low similarity
+    "Um so like I guess I do not really know what to say today but I will try my best to speak for a while. Bye.",
+    # under 20 words
+    "Hi, I am Ravi.",
+]
+BATCH_DURATIONS = [45.0, None, 20.0, 0.0]
+
+
+def test_compute_scores_batch_matches_single(stub_tool, stub_semantic):
+    batch = compute_scores_batch(BATCH_TRANSCRIPTS, BATCH_DURATIONS)
+    single = [compute_scores(t, d) for t, d in zip(BATCH_TRANSCRIPTS, BATCH_DURATIONS)]
+
+    assert batch == single
+    # one encode for exactly the transcripts that needed the fallback
+    assert len(stub_semantic.batch_calls) == 1
+    assert len(stub_semantic.batch_calls[0]) == 3
+    kw_feedback = [r["components"]["content_and_structure"]["subscores"]["keyword_presence"]["feedback"] for r in batch]
+    assert "Sufficient exact keyword matches." in kw_feedback[0]
+    assert "awarded partial credit" in kw_feedback[1]
+    assert "weak" in kw_feedback[2]
+
+
+def test_compute_scores_batch_without_durations(stub_tool, stub_semantic):
+    batch = compute_scores_batch(BATCH_TRANSCRIPTS[:2])
+
+    assert [r["duration_seconds"] for r in batch] == [None, None]
+
+
+@pytest.mark.parametrize("durations", [[10.0], [10.0, 20.0, 30.0]])
+def test_compute_scores_batch_rejects_mismatched_durations(durations):
+    with pytest.raises(ValueError):
+        compute_scores_batch(BATCH_TRANSCRIPTS[:2], durations)